@@ -1,9 +1,7 @@
 from __future__ import annotations
-from typing import Union, Any
+from typing import Union, Any, Iterable, Optional
 import math
 
-import pintless.unit as plu
-
 
 class Quantity:
     """
@@ -17,7 +15,10 @@ class Quantity:
     to new units using .to() or .ito().  This follows the API established by the pint library.
     """
 
-    def __init__(self, magnitude: Any, unit: plu.Unit) -> None:
+    # Quantities are created on every arithmetic operation, so avoid a per-instance __dict__
+    __slots__ = ("magnitude", "unit")
+
+    def __init__(self, magnitude: Any, unit: Unit) -> None:
 
         if isinstance(unit, str):
             raise TypeError(
@@ -25,18 +26,19 @@ class Quantity:
             )
 
         self.magnitude = magnitude
-        self.unit: plu.Unit = unit
+        self.unit: Unit = unit
 
     @property
-    def units(self) -> plu.Unit:
-        """Pint compatibliity property, simply returns self.unit"""
+    def units(self) -> Unit:
+        """Pint compatibility property, simply returns self.unit"""
         return self.unit
 
     @property
     def dimensionality(self) -> str:
+        """Pint compatibility property, returns the unit type of self.unit"""
         return self.unit.unit_type
 
-    def m_as(self, target_unit: Union[str, plu.Unit]) -> Any:
+    def m_as(self, target_unit: Union[str, Unit]) -> Any:
         """
         Return the magnitude of this Quantity as if it is the unit given.
         Marginally faster than .to('x').magnitude as no new Quantity object is created.
@@ -47,6 +49,9 @@ class Quantity:
         This prevents subtle conversion issues, but is also simpler, thus faster.
 
         To perform these conversions you must convert the unit then multiply by the constant (i.e. 400).
+
+        The result has no unit attached.  If no conversion is needed then the magnitude itself is
+        returned rather than a copy, so for arrays and lists this shares the same underlying data.
         """
         if isinstance(target_unit, str):
             if self.unit.registry is None:
@@ -56,16 +61,27 @@ class Quantity:
             target_unit = self.unit.registry.get_unit(target_unit)
 
         # This might happen if someone passes in a string containing numbers
-        if not isinstance(target_unit, plu.Unit):
+        if not isinstance(target_unit, Unit):
             raise ValueError("Cannot convert to a non-unit type (this may happen if converting to a string expression with numbers in it)")
 
-        conversion_factor = self.unit.conversion_factor(target_unit)
+        if target_unit is self.unit:
+            return self.magnitude
+
+        conversion_factor = _conversion_factor(self.unit, target_unit)
+        if conversion_factor == 1:
+            return self.magnitude
         if isinstance(self.magnitude, list):
             return [x * conversion_factor for x in self.magnitude]
         return self.magnitude * conversion_factor
 
-    def to(self, target_unit: Union[str, plu.Unit]) -> Quantity:
-        """Convert this Quantity to another unit"""
+    def to(self, target_unit: Union[str, Unit]) -> Quantity:
+        """
+        Convert this Quantity to another unit.
+
+        If no conversion is needed (e.g. converting km to kilometers) then the new Quantity
+        shares its magnitude with this one, rather than copying it.  Pintless never modifies
+        magnitudes in-place, so this only matters if the magnitude is modified directly.
+        """
         if isinstance(target_unit, str):
             if self.unit.registry is None:
                 raise ValueError(
@@ -74,10 +90,16 @@ class Quantity:
             target_unit = self.unit.registry.get_unit(target_unit)
 
         # This might happen if someone passes in a string containing numbers
-        if not isinstance(target_unit, plu.Unit):
+        if not isinstance(target_unit, Unit):
             raise ValueError("Cannot convert to a non-unit type (this may happen if converting to a string expression with numbers in it)")
 
-        conversion_factor = self.unit.conversion_factor(target_unit)
+        # Already in the target unit, so no arithmetic is needed
+        if target_unit is self.unit:
+            return Quantity(self.magnitude, target_unit)
+
+        conversion_factor = _conversion_factor(self.unit, target_unit)
+        if conversion_factor == 1:
+            return Quantity(self.magnitude, target_unit)
         if isinstance(self.magnitude, list):
             new_magnitude = [x * conversion_factor for x in self.magnitude]
         else:
@@ -85,7 +107,7 @@ class Quantity:
 
         return Quantity(new_magnitude, target_unit)
 
-    def ito(self, target_unit: Union[str, plu.Unit]) -> None:
+    def ito(self, target_unit: Union[str, Unit]) -> None:
         """In-place version of to"""
         if isinstance(target_unit, str):
             if self.unit.registry is None:
@@ -94,9 +116,54 @@ class Quantity:
                 )
             target_unit = self.unit.registry.get_unit(target_unit)
 
-        self.magnitude *= self.unit.conversion_factor(target_unit)
+        # This might happen if someone passes in a string containing numbers
+        if not isinstance(target_unit, Unit):
+            raise ValueError("Cannot convert to a non-unit type (this may happen if converting to a string expression with numbers in it)")
+
+        if target_unit is self.unit:
+            return
+
+        # Rebind rather than using *=, which may modify the magnitude in-place.  Magnitudes can be
+        # shared with other quantities, e.g. those returned by .to()
+        conversion_factor = _conversion_factor(self.unit, target_unit)
+        if conversion_factor != 1:
+            self.magnitude = self.magnitude * conversion_factor
         self.unit = target_unit
 
+    @classmethod
+    def sum(cls, quantities: Iterable[Quantity]) -> Quantity:
+        """
+        Sum many quantities at once, returning a Quantity in the unit of the first item.
+
+        This is equivalent to adding the quantities in turn, but only creates one Quantity object,
+        so is much faster for long sequences.  All items must be quantities with the same
+        dimensionality, and list magnitudes are not supported (as with +).
+        """
+        def check(quantity: Any) -> None:
+            if not isinstance(quantity, Quantity):
+                raise TypeError(f"Cannot sum Quantity and '{type(quantity)}'")
+            if isinstance(quantity.magnitude, list):
+                raise TypeError("Cannot sum quantities with list magnitudes")
+
+        iterator = iter(quantities)
+        try:
+            first = next(iterator)
+        except StopIteration:
+            raise ValueError("Cannot sum an empty sequence of quantities")
+        check(first)
+
+        # Avoid += here, as it would modify the first magnitude in-place if it is mutable
+        target_unit = first.unit
+        total = first.magnitude
+        for quantity in iterator:
+            check(quantity)
+            if quantity.unit is target_unit:
+                total = total + quantity.magnitude
+            else:
+                total = total + quantity.magnitude * _conversion_factor(quantity.unit, target_unit)
+
+        return cls(total, target_unit)
+
     # https://docs.python.org/3/reference/datamodel.html#emulating-numeric-types
 
     def __bool__(self) -> bool:
@@ -106,6 +173,10 @@ class Quantity:
     def __eq__(self, __o: object) -> bool:
         if isinstance(__o, Quantity):
             try:
+                # Units from a registry are shared, so try the cheap identity check first
+                if self.unit is __o.unit:
+                    return self.magnitude == __o.magnitude
+
                 return (
                     self.magnitude == __o.magnitude and self.unit == __o.unit
                 ) or self.to(__o.unit).magnitude == __o.magnitude
@@ -125,9 +196,13 @@ class Quantity:
         return Quantity(__o, self.unit.dimensionless_unit) == self
 
     def __lt__(self, __o: object) -> bool:
-        return isinstance(
-            __o, Quantity
-        ) and self.magnitude < __o.magnitude * self.unit.conversion_factor(__o.unit)
+        if not isinstance(__o, Quantity):
+            return False
+
+        if __o.unit is self.unit:
+            return self.magnitude < __o.magnitude
+
+        return self.magnitude < __o.magnitude * _conversion_factor(__o.unit, self.unit)
 
     def __add__(self, __o: object) -> Quantity:
         if not isinstance(__o, Quantity):
@@ -137,15 +212,26 @@ class Quantity:
 
             return self + Quantity(__o, self.unit.dimensionless_unit)
 
-        if self.unit.unit_type != __o.unit.unit_type:
+        # Attribute lookups are a significant part of the cost here, so only do them once
+        unit = self.unit
+        other_unit = __o.unit
+
+        # Same unit, so no conversion is needed
+        if other_unit is unit:
+            # List magnitudes aren't supported, as with the conversion below (+ would concatenate them)
+            if isinstance(self.magnitude, list) or isinstance(__o.magnitude, list):
+                raise TypeError("Cannot sum quantities with list magnitudes")
+            return Quantity(self.magnitude + __o.magnitude, unit)
+
+        if unit.unit_type != other_unit.unit_type:
             raise TypeError(
-                f"Cannot sum quantities of different dimensionalities: {self.unit.unit_type} != {__o.unit.unit_type}"
+                f"Cannot sum quantities of different dimensionalities: {unit.unit_type} != {other_unit.unit_type}"
             )
 
         # Convert other unit to this unit, then create new Quantity
         return Quantity(
-            self.magnitude + (__o.magnitude * __o.unit.conversion_factor(self.unit)),
-            self.unit,
+            self.magnitude + (__o.magnitude * _conversion_factor(other_unit, unit)),
+            unit,
         )
 
     __radd__ = __add__
@@ -158,62 +244,75 @@ class Quantity:
 
             return self - Quantity(__o, self.unit.dimensionless_unit)
 
-        if self.unit.unit_type != __o.unit.unit_type:
+        # Attribute lookups are a significant part of the cost here, so only do them once
+        unit = self.unit
+        other_unit = __o.unit
+
+        # Same unit, so no conversion is needed
+        if other_unit is unit:
+            # List magnitudes aren't supported, as with the conversion below
+            if isinstance(self.magnitude, list) or isinstance(__o.magnitude, list):
+                raise TypeError("Cannot subtract quantities with list magnitudes")
+            return Quantity(self.magnitude - __o.magnitude, unit)
+
+        if unit.unit_type != other_unit.unit_type:
             raise TypeError(
-                f"Cannot subtract quantities of different dimensionalities: {self.unit.unit_type} != {__o.unit.unit_type}"
+                f"Cannot subtract quantities of different dimensionalities: {unit.unit_type} != {other_unit.unit_type}"
             )
 
         # Convert other unit to this unit, then create new Quantity
         return Quantity(
-            self.magnitude - (__o.magnitude * __o.unit.conversion_factor(self.unit)),
-            self.unit,
+            self.magnitude - (__o.magnitude * _conversion_factor(other_unit, unit)),
+            unit,
         )
 
     __rsub__ = __sub__
 
     def __neg__(self) -> Quantity:
         """Unary negation of the obect, as in -1"""
-        return Quantity(-self.magnitude, self.unit)
+        return _new_quantity(-self.magnitude, self.unit)
 
     def __pos__(self) -> Quantity:
         """Unary positation of the obect, as in -1"""
-        return Quantity(+self.magnitude, self.unit)
+        return _new_quantity(+self.magnitude, self.unit)
 
     def __abs__(self) -> Quantity:
         """Unary positation of the obect, as in -1"""
-        return Quantity(abs(self.magnitude), self.unit)
+        return _new_quantity(abs(self.magnitude), self.unit)
 
     def __mul__(self, __o: object) -> Quantity:
         """Multiply the Quantity.  Outputs something with compound units"""
         # Someone is 'adding' units to this quantity
-        if isinstance(__o, plu.Unit):
+        if isinstance(__o, Unit):
             return Quantity(self.magnitude, self.unit * __o)
 
         if not isinstance(__o, Quantity):
             # Assume it's a magnitude.  Maybe warn on this condition?
-            __o = Quantity(__o, self.unit.dimensionless_unit)
-
-        # Multiply a/b by b/c to get ab * bc.
-        # This is a copy of the logic in Unit, in an effort to increase performance.
-        new_numerators, new_denominators, conversion_factor = self.unit.simplify(
-            self.unit.numerator_units + __o.unit.numerator_units,
-            self.unit.denominator_units + __o.unit.denominator_units,
-        )
-        new_unit = plu.Unit(
-            new_numerators,
-            new_denominators,
-            self.unit.dimensionless_base_unit,
-            self.unit.registry,
-        )
-
-        if isinstance(self.magnitude, list):
-            if isinstance(__o.magnitude, list):
+            # Multiplying by a dimensionless value cannot change the unit, so skip unit algebra.
+            magnitude = self.magnitude
+            if isinstance(magnitude, list):
+                if isinstance(__o, list):
+                    raise ValueError("Cannot multiply two list types")
+                return Quantity([x * __o for x in magnitude], self.unit)
+            return Quantity(magnitude * __o, self.unit)
+
+        # Likewise for dimensionless quantities, e.g. those parsed from numbers in expressions
+        unit = self.unit
+        if __o.unit is unit.dimensionless_unit:
+            return self * __o.magnitude
+
+        new_unit, conversion_factor = _multiply_units(unit, __o.unit)
+
+        magnitude = self.magnitude
+        other_magnitude = __o.magnitude
+        if isinstance(magnitude, list):
+            if isinstance(other_magnitude, list):
                 raise ValueError("Cannot multiply two list types")
             new_magnitude = [
-                x * __o.magnitude * conversion_factor for x in self.magnitude
+                x * other_magnitude * conversion_factor for x in magnitude
             ]
         else:
-            new_magnitude = self.magnitude * __o.magnitude * conversion_factor
+            new_magnitude = magnitude * other_magnitude * conversion_factor
 
         return Quantity(new_magnitude, new_unit)
 
@@ -222,24 +321,19 @@ class Quantity:
     def __truediv__(self, __o: object) -> Quantity:
         """'true' division, where 2/3 is 0.66 rather than 0"""
         if not isinstance(__o, Quantity):
-            if isinstance(__o, plu.Unit):
+            if isinstance(__o, Unit):
                 __o = Quantity(1, __o)
             else:
                 # Assume it's a magnitude.  Maybe warn on this condition?
-                __o = Quantity(__o, self.unit.dimensionless_unit)
+                # As with multiplication, this cannot change the unit.
+                if isinstance(self.magnitude, list):
+                    return Quantity([x / __o for x in self.magnitude], self.unit)
+                return Quantity(self.magnitude / __o, self.unit)
 
-        # If this has a denominator, flip it and then multiply it using the other mult rules.
-        # (a / b) / (c / d) == ad / bc
-        new_numerators, new_denominators, conversion_factor = self.unit.simplify(
-            self.unit.numerator_units + __o.unit.denominator_units,
-            self.unit.denominator_units + __o.unit.numerator_units,
-        )
-        new_unit = plu.Unit(
-            new_numerators,
-            new_denominators,
-            self.unit.dimensionless_base_unit,
-            self.unit.registry,
-        )
+        if __o.unit is self.unit.dimensionless_unit:
+            return self / __o.magnitude
+
+        new_unit, conversion_factor = _divide_units(self.unit, __o.unit)
 
         if isinstance(self.magnitude, list):
             new_magnitude = [
@@ -250,6 +344,17 @@ class Quantity:
 
         return Quantity(new_magnitude, new_unit)
 
+    def __rtruediv__(self, __o: object) -> Quantity:
+        """Division of a dimensionless value by this Quantity, as in 1 / x"""
+        new_unit, conversion_factor = _divide_units(self.unit.dimensionless_unit, self.unit)
+
+        if isinstance(self.magnitude, list):
+            new_magnitude = [(__o / x) * conversion_factor for x in self.magnitude]
+        else:
+            new_magnitude = (__o / self.magnitude) * conversion_factor
+
+        return Quantity(new_magnitude, new_unit)
+
     def __iter__(self):
         class QuantityIterator:
             """
@@ -258,7 +363,7 @@ class Quantity:
             This class is returned if iterating over a Quantity with a list-type magnitude
             """
 
-            def __init__(self, unit: plu.Unit, iterator):
+            def __init__(self, unit: Unit, iterator):
                 self.unit = unit
                 self.iterator = iterator
 
@@ -286,19 +391,27 @@ class Quantity:
 
     def __invert__(self) -> Quantity:
         """Unary positation of the obect, as in -1"""
-        return Quantity(~self.magnitude, self.unit)
+        return _new_quantity(~self.magnitude, self.unit)
+
+    def round_unit(self, ndigits: Optional[int] = None) -> Quantity:
+        """Round the magnitude of this Quantity, keeping the unit.  See also round()"""
+        return _new_quantity(round(self.magnitude, ndigits), self.unit)
 
-    def __round__(self, ndigits=None):
-        return Quantity(round(self.magnitude, ndigits), self.unit)
+    def __round__(self, ndigits: Optional[int] = None):
+        """Round the magnitude, returning a number without a unit.  Use .round_unit() to keep the unit"""
+        return round(self.magnitude, ndigits)
 
     def __trunc__(self):
-        return Quantity(math.trunc(self.magnitude), self.unit)
+        """Truncate the magnitude, returning a number without a unit"""
+        return math.trunc(self.magnitude)
 
     def __floor__(self):
-        return Quantity(math.floor(self.magnitude), self.unit)
+        """Floor of the magnitude, returning a number without a unit"""
+        return math.floor(self.magnitude)
 
     def __ceil__(self):
-        return Quantity(math.ceil(self.magnitude), self.unit)
+        """Ceiling of the magnitude, returning a number without a unit"""
+        return math.ceil(self.magnitude)
 
     def __complex__(self) -> complex:
         """Return a complex number with the imaginary component as 0"""
@@ -315,3 +428,20 @@ class Quantity:
 
     def __repr__(self) -> str:
         return f"<Quantity({self.magnitude}, '{self.unit.name}')>"
+
+
+def _new_quantity(magnitude: Any, unit: Unit) -> Quantity:
+    """
+    Create a Quantity without calling __init__, skipping its argument checks.
+    Only for use where unit is known to be a Unit, e.g. one taken from an existing Quantity.
+    """
+    quantity = object.__new__(Quantity)
+    quantity.magnitude = magnitude
+    quantity.unit = unit
+    return quantity
+
+
+# pintless.unit imports this module, so this import must come last to avoid a circular import.
+# Binding these as globals (rather than using pintless.unit.Unit) saves an attribute lookup
+# on every operation.
+from pintless.unit import Unit, _conversion_factor, _multiply_units, _divide_units  # noqa: E402
@@ -10,6 +10,7 @@ import pintless.errors as errors
 DEFAULT_DEFINITION_FILE = "default_units.json"
 PREFIX_KEY = "__prefixes__"
 DIMENSIONLESS_UNIT_NAME = "dimensionless"
+EXPRESSION_CACHE_SIZE = 1024
 MULTIPLY_TOKEN = "__multiply__"
 DIVIDE_TOKEN = "__divide__"
 OPEN_EXPR_TOKEN = "__start_expr__"
@@ -51,6 +52,11 @@ class Registry:
         self.utype_for_unit = {}
         self.derived_types = {}
 
+        # Units returned by get_unit, so that repeated lookups are cheap and return the same object.
+        # Expressions are kept separately as they are not valid with support_expressions=False
+        self._units_by_name = {}
+        self._units_by_expression = {}
+
         # Read prefixes then process them later
         prefixes = defs[PREFIX_KEY]
         del defs[PREFIX_KEY]
@@ -146,7 +152,6 @@ class Registry:
 
         return self.get_unit(args[0])
 
-    @lru_cache
     def get_unit(
         self, unit_name: str, support_expressions: bool = True
     ) -> Union[Unit, pintless.quantity.Quantity]:
@@ -162,11 +167,26 @@ class Registry:
             hour * watt * Hz
 
         """
+        unit = self._units_by_name.get(unit_name)
+        if unit is not None:
+            return unit
+
         if unit_name not in self.units:
             # We may have a unit that is an expression.
 
             if support_expressions:
-                return self._parse_unit_expression(unit_name)
+                unit = self._units_by_expression.get(unit_name)
+                if unit is not None:
+                    return unit
+
+                unit = self._parse_unit_expression(unit_name)
+
+                # Quantities are mutable, so only cache units
+                if isinstance(unit, Unit):
+                    if len(self._units_by_expression) >= EXPRESSION_CACHE_SIZE:
+                        self._units_by_expression.clear()
+                    self._units_by_expression[unit_name] = unit
+                return unit
 
             raise errors.UndefinedUnitError(f"Unit '{unit_name}' not round in registry")
 
@@ -177,7 +197,7 @@ class Registry:
             numerator_unit_list = [unit_name]
             denominator_unit_list = [DIMENSIONLESS_UNIT_NAME]
 
-        return Unit(
+        unit = Unit(
             [self._get_base_unit(u) for u in numerator_unit_list],
             [self._get_base_unit(u) for u in denominator_unit_list],
             self._get_base_unit(DIMENSIONLESS_UNIT_NAME),
@@ -185,6 +205,8 @@ class Registry:
             self.dimensionless_unit,
             unit_name,
         )
+        self._units_by_name[unit_name] = unit
+        return unit
 
     @lru_cache
     def _get_base_unit(self, base_unit_name: str) -> BaseUnit:
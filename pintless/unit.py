@@ -1,8 +1,9 @@
 from __future__ import annotations
-from typing import Union, List, Tuple, Optional
-from functools import lru_cache
+from typing import Union, List, Tuple, Optional, Dict, Callable
+from functools import lru_cache, partial
+from operator import mul
+import sys
 
-from .quantity import Quantity
 import pintless.registry
 
 ValidMagnitude = Union[int, float, complex]
@@ -42,14 +43,14 @@ class BaseUnit:
         conversion_factor = self.multiplier * 1 / target_unit.multiplier
         return conversion_factor
 
-    def __repr__(self) -> str:
-        return self.__str__()
-
     def __str__(self) -> str:
         return f"<BaseUnit('{self.name} = {self.multiplier} * {self.base_unit}')>"
 
+    __repr__ = __str__
+
     def __hash__(self) -> int:
-        return hash((self.name, self.unit_type, self.base_unit, self.multiplier))
+        # Must agree with __eq__, which ignores the name (e.g. km == kilometer)
+        return hash((self.unit_type, self.base_unit, self.multiplier))
 
     def __eq__(self, __o: object) -> bool:
         """Units are the same if their multiplier, base unit, and dimension are the same."""
@@ -109,6 +110,7 @@ class Unit:
         self._numerator_unit_types = None
         self._denominator_unit_types = None
         self._unit_type = None
+        self._hash = None
 
         # If this is None, it will be generated on first access
         self._name = alias
@@ -136,7 +138,11 @@ class Unit:
         if self._unit_type is not None:
             return self._unit_type
 
-        self._unit_type = f"{'*'.join(self.numerator_unit_types)}/{'*'.join(self.denominator_unit_types)}"
+        # Interned so that units of the same dimensionality share a string, making comparisons of
+        # unit_type (done on every sum and conversion) an identity check in most cases
+        self._unit_type = sys.intern(
+            f"{'*'.join(self.numerator_unit_types)}/{'*'.join(self.denominator_unit_types)}"
+        )
         return self._unit_type
 
     @property
@@ -278,8 +284,25 @@ class Unit:
 
         return conversion_factor
 
+    def converter_to(self, target_unit: Unit) -> Callable[[ValidMagnitude], ValidMagnitude]:
+        """
+        Return a function that converts a magnitude in this unit into one in the target unit.
+
+        This is intended for converting many plain values in a loop: the conversion factor is
+        computed once, so each call is a single multiplication.
+        """
+        # Check before use as a cache key, as non-unit values may not be hashable
+        if not isinstance(target_unit, Unit):
+            raise TypeError(
+                "Cannot compute conversion factor between unit and non-unit values"
+            )
+        return _converter(self, target_unit)
+
     def __eq__(self, __o: object) -> bool:
 
+        if __o is self:
+            return True
+
         if (
             not isinstance(__o, Unit)
             or len(self.numerator_units) != len(__o.numerator_units)
@@ -303,10 +326,13 @@ class Unit:
         """
         return self.unit_type == other.unit_type
 
-    # Set operations make this expensive, so cache the response
-    @lru_cache
     def __hash__(self) -> int:
-        return hash((set(self.numerator_units), set(self.denominator_units)))
+        # Units are used as cache keys on the arithmetic hot path, so compute this once
+        if self._hash is not None:
+            return self._hash
+
+        self._hash = hash((tuple(self.numerator_units), tuple(self.denominator_units)))
+        return self._hash
 
     def __mul__(
         self, __o: Union[Unit, ValidMagnitude, Quantity]
@@ -316,20 +342,8 @@ class Unit:
         # If this is also a divided unit then the denominator has to have the same
         # unit types in it
         if isinstance(__o, Unit):
-            # Multiply a/b by b/c to get ab * bc.
-            # This means concatenating the lists, but ensuring there's only ever one 'dimensionless'
-
-            new_numerators, new_denominators, _ = self.simplify(
-                self.numerator_units + __o.numerator_units,
-                self.denominator_units + __o.denominator_units,
-            )
-
-            return Unit(
-                new_numerators,
-                new_denominators,
-                self.dimensionless_base_unit,
-                self.registry,
-            )
+            new_unit, _ = _multiply_units(self, __o)
+            return new_unit
 
         if isinstance(__o, Quantity):
             return __o * self
@@ -350,17 +364,97 @@ class Unit:
         if not isinstance(__o, Unit):
             raise ValueError("Cannot divide unit by non-unit")
 
-        # If this has a denominator, flip it and then multiply it using the other mult rules.
-        # (a / b) / (c / d) == ad / bc
+        new_unit, _ = _divide_units(self, __o)
+        return new_unit
 
-        new_numerators, new_denominators, _ = self.simplify(
-            self.numerator_units + __o.denominator_units,
-            self.denominator_units + __o.numerator_units,
-        )
 
-        return Unit(
-            new_numerators,
-            new_denominators,
-            self.dimensionless_base_unit,
-            self.registry,
-        )
+# Bound for the unit algebra caches below, which are shared by Unit and Quantity.  Real workloads
+# only ever mix a handful of units, so this is generous, but keeps memory bounded for code that
+# generates many compound units.
+UNIT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _conversion_factor(from_unit: Unit, to_unit: Unit) -> float:
+    """Cached form of from_unit.conversion_factor(to_unit), used on the arithmetic hot path"""
+    return from_unit.conversion_factor(to_unit)
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _converter(from_unit: Unit, to_unit: Unit) -> Callable[[ValidMagnitude], ValidMagnitude]:
+    """Cached implementation of Unit.converter_to"""
+    return partial(mul, _conversion_factor(from_unit, to_unit))
+
+
+# Products and quotients of units, keyed by the identity of the operands.  Equal units may have
+# different names (kW*hour vs kilowatt*hour) and registries, so structural equality cannot be used
+# as the key.  Entries hold references to their operands so that an id cannot be reused while it
+# is in the cache.
+_MULTIPLY_CACHE: Dict[Tuple[int, int], Tuple[Unit, Unit, Unit, float]] = {}
+_DIVIDE_CACHE: Dict[Tuple[int, int], Tuple[Unit, Unit, Unit, float]] = {}
+
+
+def _cached_unit_operation(
+    cache: Dict[Tuple[int, int], Tuple[Unit, Unit, Unit, float]],
+    unit_a: Unit,
+    unit_b: Unit,
+    numerator_units: List[BaseUnit],
+    denominator_units: List[BaseUnit],
+) -> Tuple[Unit, float]:
+    """Simplify the unit built from the lists given, and store it in cache against unit_a and unit_b"""
+    new_numerators, new_denominators, conversion_factor = unit_a.simplify(
+        numerator_units, denominator_units
+    )
+    new_unit = Unit(
+        new_numerators,
+        new_denominators,
+        unit_a.dimensionless_base_unit,
+        unit_a.registry,
+        unit_a.dimensionless_unit,
+    )
+
+    if len(cache) >= UNIT_CACHE_SIZE:
+        cache.clear()
+    cache[(id(unit_a), id(unit_b))] = (unit_a, unit_b, new_unit, conversion_factor)
+
+    return new_unit, conversion_factor
+
+
+def _multiply_units(unit_a: Unit, unit_b: Unit) -> Tuple[Unit, float]:
+    """
+    Return the simplified unit resulting from unit_a * unit_b, and the conversion factor
+    that must be applied to the magnitude as a result of simplification.
+    """
+    cached = _MULTIPLY_CACHE.get((id(unit_a), id(unit_b)))
+    if cached is not None:
+        return cached[2], cached[3]
+
+    # Multiply a/b by b/c to get ab * bc.
+    return _cached_unit_operation(
+        _MULTIPLY_CACHE,
+        unit_a,
+        unit_b,
+        unit_a.numerator_units + unit_b.numerator_units,
+        unit_a.denominator_units + unit_b.denominator_units,
+    )
+
+
+def _divide_units(unit_a: Unit, unit_b: Unit) -> Tuple[Unit, float]:
+    """As _multiply_units, but for unit_a / unit_b"""
+    cached = _DIVIDE_CACHE.get((id(unit_a), id(unit_b)))
+    if cached is not None:
+        return cached[2], cached[3]
+
+    # If this has a denominator, flip it and then multiply it using the other mult rules.
+    # (a / b) / (c / d) == ad / bc
+    return _cached_unit_operation(
+        _DIVIDE_CACHE,
+        unit_a,
+        unit_b,
+        unit_a.numerator_units + unit_b.denominator_units,
+        unit_a.denominator_units + unit_b.numerator_units,
+    )
+
+
+# pintless.quantity imports this module, so this import must come last to avoid a circular import
+from pintless.quantity import Quantity  # noqa: E402
@@ -1,3 +1,4 @@
+import math
 import unittest
 
 from pintless import Registry, Quantity
@@ -23,6 +24,16 @@ class QuantityTest(unittest.TestCase):
         self.assertAlmostEqual(quantity.m_as("km"), 0.1)
         self.assertAlmostEqual(quantity.m_as("inch"), 3937.0078740157483)
 
+        # Expressions with numbers in are not units
+        with self.assertRaises(ValueError):
+            quantity.ito("4 km")
+        with self.assertRaises(ValueError):
+            quantity.to("4 km")
+
+        # No conversion returns the magnitude itself
+        magnitude = [1, 2, 3]
+        assert Quantity(magnitude, self.r.km).m_as("km") is magnitude
+
     def test_create_types_by_multiplication(self):
 
         r = self.r
@@ -143,3 +154,190 @@ class QuantityTest(unittest.TestCase):
 
         # Get items
         self.assertEqual(list_quantity_cm[1], Quantity(2, self.r.cm))
+
+    def test_cached_unit_arithmetic(self):
+        """Repeated arithmetic on the same units is cached, and must give the same results"""
+
+        r = self.r
+        unlinked = Registry(link_to_registry=False)
+
+        for _ in range(3):
+            self.assertEqual((10 * r.km) / (20 * r.meter), 500)
+            self.assertEqual((5 * r.meter) + (5 * r.km), 5005 * r.meter)
+            assert (5 * r.meter) < (1 * r.km)
+            assert not (5 * r.km) < (1 * r.meter)
+
+        # Equal units from different registries do not share cached results
+        assert ((1 * r.km) * (1 * r.hour)).unit.registry is r
+        assert ((1 * unlinked.km) * (1 * unlinked.hour)).unit.registry is None
+
+    def test_no_arbitrary_attributes(self):
+        """Quantity uses __slots__, so only the documented attributes can be set"""
+
+        quantity = 10 * self.r.m
+        with self.assertRaises(AttributeError):
+            quantity.foo = 4
+        assert quantity.units is quantity.unit
+
+    def test_same_unit_arithmetic(self):
+        """Operations on quantities that share a unit object skip conversion"""
+
+        r = self.r
+        a = 5 * r.meter
+        b = 2 * r.meter
+
+        self.assertEqual(a + b, 7 * r.meter)
+        self.assertEqual(a - b, 3 * r.meter)
+        assert b < a
+        assert not a < b
+
+        # Conversion to the same unit returns an equal, but distinct, quantity
+        converted = a.to(r.meter)
+        assert converted is not a
+        assert converted.unit is a.unit
+        self.assertEqual(converted, a)
+
+        a.ito(r.meter)
+        self.assertEqual(a, 5 * r.meter)
+
+    def test_scalar_arithmetic(self):
+        """Multiplying or dividing by a plain number keeps the unit"""
+
+        r = self.r
+        speed = 10 * r("km/hour")
+
+        assert (speed * 2).unit is speed.unit
+        assert (2 * speed).unit is speed.unit
+        assert (speed / 2).unit is speed.unit
+        self.assertEqual(speed * 2, 20 * r("km/hour"))
+        self.assertEqual(speed / 2, 5 * r("km/hour"))
+        self.assertEqual([1, 2] * r.cm / 2, [0.5, 1.0] * r.cm)
+
+        # Dividing a number by a quantity inverts the unit
+        self.assertEqual(1 / (4 * r.second), 0.25 * r.Hz)
+        self.assertEqual(2 / speed, 0.2 * (r.hour / r.km))
+
+    def test_shared_magnitudes_are_not_modified(self):
+        """ito() must not modify a magnitude shared with another Quantity"""
+
+        class Values:
+            """A mutable magnitude that supports in-place multiplication, like an array"""
+
+            def __init__(self, values):
+                self.values = values
+
+            def __mul__(self, factor):
+                return Values([x * factor for x in self.values])
+
+            def __imul__(self, factor):
+                self.values = [x * factor for x in self.values]
+                return self
+
+        r = self.r
+        a = Quantity(Values([1, 2]), r.km)
+        b = a.to(r.kilometer)
+        b.ito(r.m)
+
+        self.assertEqual(a.magnitude.values, [1, 2])
+        self.assertEqual(b.magnitude.values, [1000, 2000])
+
+    def test_unit_conversion_without_scaling(self):
+        """Converting between equal-scale units doesn't touch the magnitude"""
+
+        r = self.r
+        magnitude = [1, 2, 3]
+        quantity = Quantity(magnitude, r.km)
+
+        assert quantity.to(r.kilometer).magnitude is magnitude
+        assert quantity.to(r.kilometer).unit is r.kilometer
+        assert quantity.m_as(r.kilometer) is magnitude
+
+        quantity.ito(r.kilometer)
+        assert quantity.magnitude is magnitude
+        assert quantity.unit is r.kilometer
+
+    def test_sum(self):
+        """Summing many quantities at once"""
+
+        r = self.r
+
+        lengths = [1 * r.m, 2 * r.m, 1 * r.km, 100 * r.cm]
+        self.assertEqual(Quantity.sum(lengths), 1004 * r.m)
+        self.assertEqual(Quantity.sum(lengths), lengths[0] + lengths[1] + lengths[2] + lengths[3])
+        assert Quantity.sum(lengths).unit is r.m
+        self.assertEqual(Quantity.sum(q for q in [4 * r.kWh]), 4 * r.kWh)
+
+        with self.assertRaises(TypeError):
+            Quantity.sum([1 * r.m, 1 * r.second])
+        with self.assertRaises(ValueError):
+            Quantity.sum([])
+        with self.assertRaises(TypeError):
+            Quantity.sum([Quantity([1, 2], r.m), Quantity([3, 4], r.m)])
+        with self.assertRaises(TypeError):
+            Quantity.sum([1 * r.m, 0])
+        with self.assertRaises(TypeError):
+            Quantity.sum([4, 1 * r.m])
+
+    def test_rounding(self):
+        """Rounding returns the bare magnitude, unless round_unit() is used"""
+
+        quantity = 4.56 * self.r.m
+
+        self.assertEqual(round(quantity), 5)
+        self.assertEqual(round(quantity, 1), 4.6)
+        self.assertEqual(math.trunc(quantity), 4)
+        self.assertEqual(math.floor(quantity), 4)
+        self.assertEqual(math.ceil(quantity), 5)
+        assert not isinstance(round(quantity), Quantity)
+
+        self.assertEqual(quantity.round_unit(1), 4.6 * self.r.m)
+        self.assertEqual(quantity.round_unit(), 5 * self.r.m)
+
+    def test_dimensionless_arithmetic(self):
+        """Dimensionless quantities act like plain numbers in products and quotients"""
+
+        r = self.r
+        two = 2 * r.dimensionless_unit
+        length = 3 * r.km
+
+        assert (length * two).unit is r.km
+        assert (two * length).unit == r.km
+        assert (length / two).unit is r.km
+        self.assertEqual(length * two, 6 * r.km)
+        self.assertEqual(two * length, 6 * r.km)
+        self.assertEqual(length / two, 1.5 * r.km)
+        self.assertEqual([1, 2] * r.cm * two, [2, 4] * r.cm)
+
+        # Lists on the dimensionless side are scaled, not repeated
+        self.assertEqual(
+            Quantity([1, 2], r.dimensionless_unit) * (3 * r.second), Quantity([3, 6], r.second)
+        )
+        self.assertEqual(
+            (Quantity([1, 2], r.m) / Quantity(1, r.m)) * Quantity(3, r.second),
+            Quantity([3.0, 6.0], r.second),
+        )
+        self.assertEqual(r("4 * 7"), 28)
+
+    def test_unary_operators(self):
+
+        r = self.r
+        quantity = -4 * r.kWh
+
+        self.assertEqual(-quantity, 4 * r.kWh)
+        self.assertEqual(+quantity, -4 * r.kWh)
+        self.assertEqual(abs(quantity), 4 * r.kWh)
+        self.assertEqual(~quantity, 3 * r.kWh)
+        assert isinstance(-quantity, Quantity)
+        assert (-quantity).unit is quantity.unit
+
+    def test_list_addition(self):
+        """Lists are not summed element-wise, whether or not the units match"""
+
+        r = self.r
+
+        with self.assertRaises(TypeError):
+            Quantity([1, 2], r.m) + Quantity([3, 4], r.m)
+        with self.assertRaises(TypeError):
+            Quantity([1, 2], r.m) - Quantity([3, 4], r.m)
+        with self.assertRaises(TypeError):
+            Quantity([1, 2], r.m) + Quantity([3, 4], r.km)
@@ -145,3 +145,22 @@ class RegistryTest(unittest.TestCase):
         assert qmetres.magnitude == 10
         cm = qmetres.to(r.cm)
         assert cm.magnitude == 10 * 100
+
+    def test_unit_lookup_cache(self):
+        """Looking up the same unit repeatedly returns the same object"""
+
+        r = self.r
+
+        assert r.get_unit("meter") is r.meter
+        assert r("km / hour") is r("km / hour")
+        assert Registry().meter is not r.meter
+
+        # Quantities are mutable, so are not shared between lookups
+        quantity = r("4 kWh")
+        quantity.ito(r.joule)
+        self.assertEqual(r("4 kWh").magnitude, 4)
+        assert r("4 kWh") is not r("4 kWh")
+
+        # Cached expressions still require support_expressions
+        with self.assertRaises(UndefinedUnitError):
+            r.get_unit("km / hour", support_expressions=False)
@@ -154,3 +154,46 @@ class UnitTest(unittest.TestCase):
         self.assertEqual((10 * r.km) / (20 * r.km), 0.5 * r.dimensionless)
         self.assertEqual((10 * r.km) / (20 * r.meter), 500)
         self.assertEqual((10 * r.km) * (5 * r.meter), 50 * r.km * r.meter)
+
+    def test_hash(self):
+        """Equal units must hash equally so they can be used as cache keys"""
+
+        r = self.r
+
+        assert hash(r.kWh) == hash(r.kW * r.hour)
+        assert hash(r.km) == hash(r.kilometer)
+        assert len({r.meter, r.get_unit("meter"), r.m}) == 1
+
+    def test_cached_unit_arithmetic(self):
+        """Products and quotients of the same unit objects are computed once"""
+
+        r = self.r
+
+        assert r.kW * r.hour is r.kW * r.hour
+        assert r.kWh / r.second is r.kWh / r.second
+
+        # Equal units with different names keep their own names
+        assert str(r.kW * r.hour) == "kW*hour"
+        assert str(r.kilowatt * r.hour) == "kilowatt*hour"
+        assert str((1 * r.kilowatt) * (1 * r.hour)) == "1 kilowatt*hour"
+
+    def test_dimensionality_interned(self):
+        """Units of the same dimensionality share a single unit_type string"""
+
+        assert self.r.meter.unit_type is self.r.inch.unit_type
+        assert self.r.kWh.unit_type is (self.r.watt * self.r.second).unit_type
+
+    def test_converter(self):
+        """Converters apply a precomputed conversion factor to plain values"""
+
+        r = self.r
+
+        to_cm = r.meter.converter_to(r.cm)
+        self.assertEqual([to_cm(x) for x in [1, 2, 3]], [100, 200, 300])
+        self.assertAlmostEqual(r("km/hour").converter_to(r("m/second"))(36), 10)
+        assert r.meter.converter_to(r.cm) is to_cm
+
+        with self.assertRaises(TypeError):
+            r.meter.converter_to(r.hour)
+        with self.assertRaises(TypeError):
+            r.meter.converter_to(r("4 km"))